@@ -3,11 +3,13 @@
 import base64
 import mimetypes
 import platform
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from nanobot.agent.memory import MemoryStore
 from nanobot.agent.skills import SkillsLoader
+from nanobot.utils.helpers import read_text_cached
 
 
 class ContextBuilder:
@@ -24,6 +26,12 @@ class ContextBuilder:
         self.workspace = workspace
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace)
+        # Fixed for the process lifetime; resolve once rather than per message
+        self._workspace_path = str(workspace.expanduser().resolve())
+        system = platform.system()
+        self._runtime = f"{'macOS' if system == 'Darwin' else system} {platform.machine()}, Python {platform.python_version()}"
+        # Bootstrap files are re-read only when their mtime or size changes
+        self._file_cache: dict[Path, tuple[int, int, str]] = {}
     
     def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
         """
@@ -68,15 +76,16 @@ Skills with available="false" need dependencies installed first - you can try in
 
 {skills_summary}""")
         
+        # Volatile details go last so everything above is a stable prefix for provider prompt caching
+        now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
+        parts.append(f"## Current Time\n{now}")
+        
         return "\n\n---\n\n".join(parts)
     
     def _get_identity(self) -> str:
         """Get the core identity section."""
-        from datetime import datetime
-        now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
-        workspace_path = str(self.workspace.expanduser().resolve())
-        system = platform.system()
-        runtime = f"{'macOS' if system == 'Darwin' else system} {platform.machine()}, Python {platform.python_version()}"
+        workspace_path = self._workspace_path
+        runtime = self._runtime
         
         return f"""# nanobot 🐈
 
@@ -87,9 +96,6 @@ You are nanobot, a helpful AI assistant. You have access to tools that allow you
 - Send messages to users on chat channels
 - Spawn subagents for complex background tasks
 
-## Current Time
-{now}
-
 ## Runtime
 {runtime}
 
@@ -111,9 +117,8 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         parts = []
         
         for filename in self.BOOTSTRAP_FILES:
-            file_path = self.workspace / filename
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
+            content = read_text_cached(self.workspace / filename, self._file_cache)
+            if content is not None:
                 parts.append(f"## {filename}\n\n{content}")
         
         return "\n\n".join(parts) if parts else ""
@@ -184,7 +189,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         result: str
     ) -> list[dict[str, Any]]:
         """
-        Add a tool result to the message list.
+        Add a tool result to the message list (appended in place).
         
         Args:
             messages: Current message list.
@@ -193,7 +198,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             result: Tool execution result.
         
         Returns:
-            Updated message list.
+            The same message list, for chaining.
         """
         messages.append({
             "role": "tool",
@@ -211,7 +216,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         reasoning_content: str | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Add an assistant message to the message list.
+        Add an assistant message to the message list (appended in place).
         
         Args:
             messages: Current message list.
@@ -220,7 +225,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             reasoning_content: Thinking output (Kimi, DeepSeek-R1, etc.).
         
         Returns:
-            Updated message list.
+            The same message list, for chaining.
         """
         msg: dict[str, Any] = {"role": "assistant", "content": content or ""}
         
@@ -1,7 +1,9 @@
 """Agent loop: the core processing engine."""
 
 import asyncio
-import json
+import functools
+import re
+import weakref
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,8 @@ from loguru import logger
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
+from nanobot.config.schema import ExecToolConfig
+from nanobot.cron.service import CronService
 from nanobot.providers.base import LLMProvider
 from nanobot.agent.context import ContextBuilder
 from nanobot.agent.tools.registry import ToolRegistry
@@ -19,7 +23,10 @@ from nanobot.agent.tools.message import MessageTool
 from nanobot.agent.tools.spawn import SpawnTool
 from nanobot.agent.tools.cron import CronTool
 from nanobot.agent.subagent import SubagentManager
-from nanobot.session.manager import SessionManager
+from nanobot.session.manager import Session, SessionManager
+
+# How the tools phrase failures: "Error: ..." or "Error reading file: ...", "Error executing ..."
+_TOOL_ERROR_RE = re.compile(r"Error(?::| \w+ing\b)")
 
 
 class AgentLoop:
@@ -42,13 +49,12 @@ class AgentLoop:
         model: str | None = None,
         max_iterations: int = 20,
         brave_api_key: str | None = None,
-        exec_config: "ExecToolConfig | None" = None,
-        cron_service: "CronService | None" = None,
+        exec_config: ExecToolConfig | None = None,
+        cron_service: CronService | None = None,
         restrict_to_workspace: bool = False,
         session_manager: SessionManager | None = None,
+        max_concurrency: int = 8,
     ):
-        from nanobot.config.schema import ExecToolConfig
-        from nanobot.cron.service import CronService
         self.bus = bus
         self.provider = provider
         self.workspace = workspace
@@ -58,6 +64,7 @@ class AgentLoop:
         self.exec_config = exec_config or ExecToolConfig()
         self.cron_service = cron_service
         self.restrict_to_workspace = restrict_to_workspace
+        self.max_concurrency = max(1, max_concurrency)
         
         self.context = ContextBuilder(workspace)
         self.sessions = session_manager or SessionManager(workspace)
@@ -73,6 +80,13 @@ class AgentLoop:
         )
         
         self._running = False
+        self._stop_event = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._pending_saves: set[asyncio.Task[None]] = set()
         self._register_default_tools()
     
     def _register_default_tools(self) -> None:
@@ -96,31 +110,73 @@ class AgentLoop:
         self.tools.register(WebFetchTool())
         
         # Message tool
-        message_tool = MessageTool(send_callback=self.bus.publish_outbound)
-        self.tools.register(message_tool)
+        self._message_tool = MessageTool(send_callback=self.bus.publish_outbound)
+        self.tools.register(self._message_tool)
         
         # Spawn tool (for subagents)
-        spawn_tool = SpawnTool(manager=self.subagents)
-        self.tools.register(spawn_tool)
+        self._spawn_tool = SpawnTool(manager=self.subagents)
+        self.tools.register(self._spawn_tool)
         
         # Cron tool (for scheduling)
+        self._cron_tool: CronTool | None = None
         if self.cron_service:
-            self.tools.register(CronTool(self.cron_service))
+            self._cron_tool = CronTool(self.cron_service)
+            self.tools.register(self._cron_tool)
+    
+    def _set_tool_context(self, channel: str, chat_id: str) -> None:
+        """Point the routing-aware tools at the current conversation."""
+        self._message_tool.set_context(channel, chat_id)
+        self._spawn_tool.set_context(channel, chat_id)
+        if self._cron_tool:
+            self._cron_tool.set_context(channel, chat_id)
     
     async def run(self) -> None:
-        """Run the agent loop, processing messages from the bus."""
+        """
+        Run the agent loop, processing messages from the bus.
+        
+        Up to ``max_concurrency`` messages are processed at once; messages
+        for the same session are still handled one at a time, in order.
+        """
         self._running = True
+        self._stop_event.clear()
         logger.info("Agent loop started")
         
         while self._running:
-            try:
-                # Wait for next message
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
-                )
-                
-                # Process it
+            # Wait for a free slot so the backlog stays on the bus
+            await self._slots.acquire()
+            msg = await self._next_message()
+            if msg is None:
+                self._slots.release()
+                break
+            
+            # Process it in the background
+            task = asyncio.create_task(self._dispatch(msg))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        
+        # Let in-flight messages finish and their sessions reach disk
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush_saves()
+    
+    async def _next_message(self) -> InboundMessage | None:
+        """Wait for the next inbound message; returns None once stop() is called."""
+        consume = asyncio.create_task(self.bus.consume_inbound())
+        stopped = asyncio.create_task(self._stop_event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {consume, stopped}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            # Also on cancellation: a stray consume task would swallow the next message
+            consume.cancel()
+            stopped.cancel()
+        return consume.result() if consume in done else None
+    
+    async def _dispatch(self, msg: InboundMessage) -> None:
+        """Process one bus message under its session lock and publish the reply."""
+        try:
+            async with self._session_lock(msg):
                 try:
                     response = await self._process_message(msg)
                     if response:
@@ -133,12 +189,43 @@ class AgentLoop:
                         chat_id=msg.chat_id,
                         content=f"Sorry, I encountered an error: {str(e)}"
                     ))
-            except asyncio.TimeoutError:
-                continue
+        finally:
+            self._slots.release()
+    
+    def _session_lock(self, msg: InboundMessage) -> asyncio.Lock:
+        """Get the lock that serializes processing for the message's session."""
+        key = msg.session_key
+        if msg.channel == "system":
+            # Subagent announces belong to the "channel:chat_id" they report back to
+            key = msg.chat_id if ":" in msg.chat_id else f"cli:{msg.chat_id}"
+        
+        lock = self._session_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._session_locks[key] = lock
+        return lock
+    
+    def _schedule_save(self, session: Session) -> None:
+        """Persist a session in the background so the reply isn't held up by disk I/O."""
+        task = asyncio.create_task(self._save_session(session))
+        self._pending_saves.add(task)
+        task.add_done_callback(self._pending_saves.discard)
+    
+    async def _save_session(self, session: Session) -> None:
+        try:
+            await self.sessions.save_async(session)
+        except Exception as e:
+            logger.error(f"Failed to save session {session.key}: {e}")
+    
+    async def flush_saves(self) -> None:
+        """Wait for all background session saves to complete."""
+        if self._pending_saves:
+            await asyncio.gather(*self._pending_saves)
     
     def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
+        self._stop_event.set()
         logger.info("Agent loop stopping")
     
     async def _process_message(self, msg: InboundMessage) -> OutboundMessage | None:
@@ -163,72 +250,22 @@ class AgentLoop:
         session = self.sessions.get_or_create(msg.session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(msg.channel, msg.chat_id)
-        
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(msg.channel, msg.chat_id)
-        
-        cron_tool = self.tools.get("cron")
-        if isinstance(cron_tool, CronTool):
-            cron_tool.set_context(msg.channel, msg.chat_id)
+        self._set_tool_context(msg.channel, msg.chat_id)
         
         # Build initial messages (use get_history for LLM-formatted messages)
-        messages = self.context.build_messages(
+        build = functools.partial(
+            self.context.build_messages,
             history=session.get_history(),
             current_message=msg.content,
             media=msg.media if msg.media else None,
             channel=msg.channel,
             chat_id=msg.chat_id,
         )
+        # Reading and base64-encoding images would stall every other session
+        messages = await asyncio.to_thread(build) if msg.media else build()
         
         # Agent loop
-        iteration = 0
-        final_content = None
-        
-        while iteration < self.max_iterations:
-            iteration += 1
-            
-            # Call LLM
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=self.model
-            )
-            
-            # Handle tool calls
-            if response.has_tool_calls:
-                # Add assistant message with tool calls
-                tool_call_dicts = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)  # Must be JSON string
-                        }
-                    }
-                    for tc in response.tool_calls
-                ]
-                messages = self.context.add_assistant_message(
-                    messages, response.content, tool_call_dicts,
-                    reasoning_content=response.reasoning_content,
-                )
-                
-                # Execute tools
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
-            else:
-                # No tool calls, we're done
-                final_content = response.content
-                break
+        final_content = await self._run_tool_loop(messages)
         
         if final_content is None:
             final_content = "I've completed processing but have no response to give."
@@ -240,7 +277,7 @@ class AgentLoop:
         # Save to session
         session.add_message("user", msg.content)
         session.add_message("assistant", final_content)
-        self.sessions.save(session)
+        self._schedule_save(session)
         
         return OutboundMessage(
             channel=msg.channel,
@@ -273,17 +310,7 @@ class AgentLoop:
         session = self.sessions.get_or_create(session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(origin_channel, origin_chat_id)
-        
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(origin_channel, origin_chat_id)
-        
-        cron_tool = self.tools.get("cron")
-        if isinstance(cron_tool, CronTool):
-            cron_tool.set_context(origin_channel, origin_chat_id)
+        self._set_tool_context(origin_channel, origin_chat_id)
         
         # Build messages with the announce content
         messages = self.context.build_messages(
@@ -293,46 +320,8 @@ class AgentLoop:
             chat_id=origin_chat_id,
         )
         
-        # Agent loop (limited for announce handling)
-        iteration = 0
-        final_content = None
-        
-        while iteration < self.max_iterations:
-            iteration += 1
-            
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=self.model
-            )
-            
-            if response.has_tool_calls:
-                tool_call_dicts = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)
-                        }
-                    }
-                    for tc in response.tool_calls
-                ]
-                messages = self.context.add_assistant_message(
-                    messages, response.content, tool_call_dicts,
-                    reasoning_content=response.reasoning_content,
-                )
-                
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
-            else:
-                final_content = response.content
-                break
+        # Agent loop
+        final_content = await self._run_tool_loop(messages)
         
         if final_content is None:
             final_content = "Background task completed."
@@ -340,7 +329,7 @@ class AgentLoop:
         # Save to session (mark as system message in history)
         session.add_message("user", f"[System: {msg.sender_id}] {msg.content}")
         session.add_message("assistant", final_content)
-        self.sessions.save(session)
+        self._schedule_save(session)
         
         return OutboundMessage(
             channel=origin_channel,
@@ -348,6 +337,64 @@ class AgentLoop:
             content=final_content
         )
     
+    async def _run_tool_loop(self, messages: list[dict[str, Any]]) -> str | None:
+        """
+        Call the LLM and execute its tool calls until it gives a final answer.
+        
+        Args:
+            messages: Initial messages; tool turns are appended in place.
+        
+        Returns:
+            The final response content, or None if max_iterations was reached.
+        """
+        tool_defs = self.tools.get_definitions()
+        # Calls that failed in the previous iteration; asking for one again straight away
+        # means the model is stuck (older failures may have been fixed in between)
+        failed_calls: set[tuple[str, str]] = set()
+        
+        for _ in range(self.max_iterations):
+            # Call LLM
+            response = await self.provider.chat(
+                messages=messages,
+                tools=tool_defs,
+                model=self.model
+            )
+            
+            if not response.has_tool_calls:
+                # No tool calls, we're done
+                return response.content
+            
+            repeated = next(
+                (tc for tc in response.tool_calls if (tc.name, tc.arguments_json) in failed_calls),
+                None,
+            )
+            if repeated:
+                logger.warning(f"Repeated failing tool call {repeated.name}, stopping early")
+                return f"Stopped: the {repeated.name} tool call kept failing with the same arguments."
+            
+            # Add assistant message with tool calls
+            tool_call_dicts = [tc.to_openai_dict() for tc in response.tool_calls]
+            self.context.add_assistant_message(
+                messages, response.content, tool_call_dicts,
+                reasoning_content=response.reasoning_content,
+            )
+            
+            # Execute tools (independent read-only calls run concurrently)
+            for tool_call in response.tool_calls:
+                logger.info(f"Tool call: {tool_call.name}({tool_call.arguments_json[:200]})")
+            results = await self.tools.execute_batch(
+                [(tc.name, tc.arguments) for tc in response.tool_calls]
+            )
+            failed_calls = set()
+            for tool_call, result in zip(response.tool_calls, results):
+                self.context.add_tool_result(
+                    messages, tool_call.id, tool_call.name, result
+                )
+                if _TOOL_ERROR_RE.match(result):
+                    failed_calls.add((tool_call.name, tool_call.arguments_json))
+        
+        return None
+    
     async def process_direct(
         self,
         content: str,
@@ -375,4 +422,6 @@ class AgentLoop:
         )
         
         response = await self._process_message(msg)
+        # Direct callers (CLI, cron) may exit right away; don't leave saves behind
+        await self.flush_saves()
         return response.content if response else ""
@@ -3,7 +3,7 @@
 from pathlib import Path
 from datetime import datetime
 
-from nanobot.utils.helpers import ensure_dir, today_date
+from nanobot.utils.helpers import ensure_dir, read_text_cached, today_date
 
 
 class MemoryStore:
@@ -17,6 +17,7 @@ class MemoryStore:
         self.workspace = workspace
         self.memory_dir = ensure_dir(workspace / "memory")
         self.memory_file = self.memory_dir / "MEMORY.md"
+        self._file_cache: dict[Path, tuple[int, int, str]] = {}
     
     def get_today_file(self) -> Path:
         """Get path to today's memory file."""
@@ -24,10 +25,7 @@ class MemoryStore:
     
     def read_today(self) -> str:
         """Read today's memory notes."""
-        today_file = self.get_today_file()
-        if today_file.exists():
-            return today_file.read_text(encoding="utf-8")
-        return ""
+        return read_text_cached(self.get_today_file(), self._file_cache) or ""
     
     def append_today(self, content: str) -> None:
         """Append content to today's memory notes."""
@@ -45,9 +43,7 @@ class MemoryStore:
     
     def read_long_term(self) -> str:
         """Read long-term memory (MEMORY.md)."""
-        if self.memory_file.exists():
-            return self.memory_file.read_text(encoding="utf-8")
-        return ""
+        return read_text_cached(self.memory_file, self._file_cache) or ""
     
     def write_long_term(self, content: str) -> None:
         """Write to long-term memory (MEMORY.md)."""
@@ -6,6 +6,8 @@ import re
 import shutil
 from pathlib import Path
 
+from nanobot.utils.helpers import read_text_cached
+
 # Default builtin skills directory (relative to this file)
 BUILTIN_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
@@ -22,6 +24,8 @@ class SkillsLoader:
         self.workspace = workspace
         self.workspace_skills = workspace / "skills"
         self.builtin_skills = builtin_skills_dir or BUILTIN_SKILLS_DIR
+        # SKILL.md files are read several times per prompt; only re-read them when they change
+        self._file_cache: dict[Path, tuple[int, int, str]] = {}
     
     def list_skills(self, filter_unavailable: bool = True) -> list[dict[str, str]]:
         """
@@ -67,15 +71,13 @@ class SkillsLoader:
             Skill content or None if not found.
         """
         # Check workspace first
-        workspace_skill = self.workspace_skills / name / "SKILL.md"
-        if workspace_skill.exists():
-            return workspace_skill.read_text(encoding="utf-8")
+        content = read_text_cached(self.workspace_skills / name / "SKILL.md", self._file_cache)
+        if content is not None:
+            return content
         
         # Check built-in
         if self.builtin_skills:
-            builtin_skill = self.builtin_skills / name / "SKILL.md"
-            if builtin_skill.exists():
-                return builtin_skill.read_text(encoding="utf-8")
+            return read_text_cached(self.builtin_skills / name / "SKILL.md", self._file_cache)
         
         return None
     
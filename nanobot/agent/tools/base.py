@@ -1,7 +1,12 @@
 """Base class for agent tools."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from contextvars import ContextVar
+from functools import cached_property
+from typing import Any, Callable
+
+# (value, path) -> error messages
+Validator = Callable[[Any, str], list[str]]
 
 
 class Tool(ABC):
@@ -21,6 +26,10 @@ class Tool(ABC):
         "object": dict,
     }
     
+    # Read-only tools with no shared state may run alongside each other
+    # when the LLM emits several calls in one turn.
+    concurrency_safe: bool = False
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -54,41 +63,81 @@ class Tool(ABC):
 
     def validate_params(self, params: dict[str, Any]) -> list[str]:
         """Validate tool parameters against JSON schema. Returns error list (empty if valid)."""
+        return self.validator(params, "")
+
+    @cached_property
+    def validator(self) -> Validator:
+        """The parameter schema compiled into a validator, built on first use."""
         schema = self.parameters or {}
         if schema.get("type", "object") != "object":
             raise ValueError(f"Schema must be object type, got {schema.get('type')!r}")
-        return self._validate(params, {**schema, "type": "object"}, "")
+        return self._compile({**schema, "type": "object"})
 
-    def _validate(self, val: Any, schema: dict[str, Any], path: str) -> list[str]:
-        t, label = schema.get("type"), path or "parameter"
-        if t in self._TYPE_MAP and not isinstance(val, self._TYPE_MAP[t]):
-            return [f"{label} should be {t}"]
-        
-        errors = []
-        if "enum" in schema and val not in schema["enum"]:
-            errors.append(f"{label} must be one of {schema['enum']}")
+    def _compile(self, schema: dict[str, Any]) -> Validator:
+        """Turn a schema node into a closure so calls don't re-walk the schema dict."""
+        t = schema.get("type")
+        expected = self._TYPE_MAP.get(t)
+        checks: list[Callable[[Any, str, list[str]], None]] = []
+
+        if "enum" in schema:
+            enum = schema["enum"]
+            def check_enum(val: Any, path: str, errors: list[str]) -> None:
+                if val not in enum:
+                    errors.append(f"{path or 'parameter'} must be one of {enum}")
+            checks.append(check_enum)
         if t in ("integer", "number"):
-            if "minimum" in schema and val < schema["minimum"]:
-                errors.append(f"{label} must be >= {schema['minimum']}")
-            if "maximum" in schema and val > schema["maximum"]:
-                errors.append(f"{label} must be <= {schema['maximum']}")
+            if "minimum" in schema:
+                minimum = schema["minimum"]
+                def check_minimum(val: Any, path: str, errors: list[str]) -> None:
+                    if val < minimum:
+                        errors.append(f"{path or 'parameter'} must be >= {minimum}")
+                checks.append(check_minimum)
+            if "maximum" in schema:
+                maximum = schema["maximum"]
+                def check_maximum(val: Any, path: str, errors: list[str]) -> None:
+                    if val > maximum:
+                        errors.append(f"{path or 'parameter'} must be <= {maximum}")
+                checks.append(check_maximum)
         if t == "string":
-            if "minLength" in schema and len(val) < schema["minLength"]:
-                errors.append(f"{label} must be at least {schema['minLength']} chars")
-            if "maxLength" in schema and len(val) > schema["maxLength"]:
-                errors.append(f"{label} must be at most {schema['maxLength']} chars")
+            if "minLength" in schema:
+                min_len = schema["minLength"]
+                def check_min_length(val: Any, path: str, errors: list[str]) -> None:
+                    if len(val) < min_len:
+                        errors.append(f"{path or 'parameter'} must be at least {min_len} chars")
+                checks.append(check_min_length)
+            if "maxLength" in schema:
+                max_len = schema["maxLength"]
+                def check_max_length(val: Any, path: str, errors: list[str]) -> None:
+                    if len(val) > max_len:
+                        errors.append(f"{path or 'parameter'} must be at most {max_len} chars")
+                checks.append(check_max_length)
         if t == "object":
-            props = schema.get("properties", {})
-            for k in schema.get("required", []):
-                if k not in val:
-                    errors.append(f"missing required {path + '.' + k if path else k}")
-            for k, v in val.items():
-                if k in props:
-                    errors.extend(self._validate(v, props[k], path + '.' + k if path else k))
+            required = list(schema.get("required", []))
+            props = {k: self._compile(v) for k, v in schema.get("properties", {}).items()}
+            def check_object(val: Any, path: str, errors: list[str]) -> None:
+                for k in required:
+                    if k not in val:
+                        errors.append(f"missing required {path + '.' + k if path else k}")
+                for k, v in val.items():
+                    if k in props:
+                        errors.extend(props[k](v, path + '.' + k if path else k))
+            checks.append(check_object)
         if t == "array" and "items" in schema:
-            for i, item in enumerate(val):
-                errors.extend(self._validate(item, schema["items"], f"{path}[{i}]" if path else f"[{i}]"))
-        return errors
+            items = self._compile(schema["items"])
+            def check_array(val: Any, path: str, errors: list[str]) -> None:
+                for i, item in enumerate(val):
+                    errors.extend(items(item, f"{path}[{i}]" if path else f"[{i}]"))
+            checks.append(check_array)
+
+        def validate(val: Any, path: str) -> list[str]:
+            if expected is not None and not isinstance(val, expected):
+                return [f"{path or 'parameter'} should be {t}"]
+            errors: list[str] = []
+            for check in checks:
+                check(val, path, errors)
+            return errors
+
+        return validate
     
     def to_schema(self) -> dict[str, Any]:
         """Convert tool to OpenAI function schema format."""
@@ -100,3 +149,24 @@ class Tool(ABC):
                 "parameters": self.parameters,
             }
         }
+
+
+class ChatContext:
+    """
+    The (channel, chat_id) a routing-aware tool acts for.
+    
+    Tools are shared by every message the agent handles, and several messages
+    may be in flight at once. The value lives in a ContextVar, so each asyncio
+    task (one per message) sees only the conversation it set.
+    """
+    
+    def __init__(self, name: str, channel: str = "", chat_id: str = ""):
+        self._var: ContextVar[tuple[str, str]] = ContextVar(name, default=(channel, chat_id))
+    
+    def set(self, channel: str, chat_id: str) -> None:
+        """Route the current task's tool calls to this conversation."""
+        self._var.set((channel, chat_id))
+    
+    def get(self) -> tuple[str, str]:
+        """Return the current task's (channel, chat_id)."""
+        return self._var.get()
@@ -17,6 +17,8 @@ def _resolve_path(path: str, allowed_dir: Path | None = None) -> Path:
 class ReadFileTool(Tool):
     """Tool to read file contents."""
     
+    concurrency_safe = True
+    
     def __init__(self, allowed_dir: Path | None = None):
         self._allowed_dir = allowed_dir
 
@@ -164,6 +166,8 @@ class EditFileTool(Tool):
 class ListDirTool(Tool):
     """Tool to list directory contents."""
     
+    concurrency_safe = True
+    
     def __init__(self, allowed_dir: Path | None = None):
         self._allowed_dir = allowed_dir
 
@@ -1,5 +1,7 @@
 """Tool registry for dynamic tool management."""
 
+import asyncio
+import json
 from typing import Any
 
 from nanobot.agent.tools.base import Tool
@@ -14,14 +16,23 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._definitions: list[dict[str, Any]] | None = None
     
     def register(self, tool: Tool) -> None:
-        """Register a tool."""
+        """
+        Register a tool.
+        
+        Its parameter validator is compiled here, so a bad schema fails at
+        startup and the first call doesn't pay for compilation.
+        """
+        tool.validator
         self._tools[tool.name] = tool
+        self._definitions = None
     
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._tools.pop(name, None)
+        self._definitions = None
     
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -32,8 +43,15 @@ class ToolRegistry:
         return name in self._tools
     
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """
+        Get all tool definitions in OpenAI format.
+        
+        The list is built once and reused until the registry changes;
+        callers must treat it as read-only.
+        """
+        if self._definitions is None:
+            self._definitions = [tool.to_schema() for tool in self._tools.values()]
+        return self._definitions
     
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """
@@ -61,6 +79,48 @@ class ToolRegistry:
         except Exception as e:
             return f"Error executing {name}: {str(e)}"
     
+    async def execute_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[str]:
+        """
+        Execute the tool calls from one LLM response.
+        
+        Consecutive calls to concurrency-safe tools run together (identical
+        ones only once); any other call runs on its own, so side effects
+        keep the order the LLM chose.
+        
+        Args:
+            calls: (name, params) pairs in the order they were requested.
+        
+        Returns:
+            Tool results, in the same order as ``calls``.
+        """
+        results: list[str] = []
+        group: list[tuple[str, dict[str, Any]]] = []
+        
+        for name, params in calls:
+            tool = self._tools.get(name)
+            if tool and tool.concurrency_safe:
+                group.append((name, params))
+                continue
+            if group:
+                results.extend(await self._execute_group(group))
+                group = []
+            results.append(await self.execute(name, params))
+        
+        if group:
+            results.extend(await self._execute_group(group))
+        return results
+    
+    async def _execute_group(self, group: list[tuple[str, dict[str, Any]]]) -> list[str]:
+        """Run concurrency-safe calls together, sharing results of identical calls."""
+        running: dict[tuple[str, str], asyncio.Future[str]] = {}
+        futures = []
+        for name, params in group:
+            key = (name, json.dumps(params, sort_keys=True, default=str))
+            if key not in running:
+                running[key] = asyncio.ensure_future(self.execute(name, params))
+            futures.append(running[key])
+        return list(await asyncio.gather(*futures))
+    
     @property
     def tool_names(self) -> list[str]:
         """Get list of registered tool names."""
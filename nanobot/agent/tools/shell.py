@@ -3,15 +3,55 @@
 import asyncio
 import os
 import re
+import shlex
+import shutil
 from pathlib import Path
 from typing import Any
 
 from nanobot.agent.tools.base import Tool
 
+# Absolute-path candidates checked by the workspace guard
+_WIN_PATH_RE = re.compile(r"[A-Za-z]:\\[^\\\"']+")
+_POSIX_PATH_RE = re.compile(r"/[^\s\"']+")
+
+# Bytes kept per output stream; the rest is drained and counted so the child never blocks.
+# Comfortably above the 10000-char result limit even for multi-byte text.
+_STREAM_CAP = 64 * 1024
+
+# Anything beyond plain words and quoting needs a real shell to interpret it
+_SHELL_METACHARS = frozenset("|&;<>()$`*?[]{}~#!\n\r")
+
+# Shell builtins; several also exist as binaries (echo, printf, test, cd on some
+# systems) that behave differently, so these always go through the shell
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "[", "alias", "bg", "break", "cd", "command", "continue", "echo",
+    "eval", "exec", "exit", "export", "false", "fc", "fg", "getopts", "hash",
+    "jobs", "kill", "local", "newgrp", "printf", "pwd", "read", "readonly",
+    "return", "set", "shift", "source", "test", "times", "trap", "true", "type",
+    "ulimit", "umask", "unalias", "unset", "wait",
+})
+
 
 class ExecTool(Tool):
     """Tool to execute shell commands."""
     
+    name = "exec"
+    description = "Execute a shell command and return its output. Use with caution."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "command": {
+                "type": "string",
+                "description": "The shell command to execute"
+            },
+            "working_dir": {
+                "type": "string",
+                "description": "Optional working directory for the command"
+            }
+        },
+        "required": ["command"]
+    }
+    
     def __init__(
         self,
         timeout: int = 60,
@@ -34,31 +74,14 @@ class ExecTool(Tool):
         ]
         self.allow_patterns = allow_patterns or []
         self.restrict_to_workspace = restrict_to_workspace
+        # One fused pattern per list: a single scan per command instead of a re.search per pattern
+        self._deny_re = self._fuse(self.deny_patterns)
+        self._allow_re = self._fuse(self.allow_patterns) if self.allow_patterns else None
     
-    @property
-    def name(self) -> str:
-        return "exec"
-    
-    @property
-    def description(self) -> str:
-        return "Execute a shell command and return its output. Use with caution."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "The shell command to execute"
-                },
-                "working_dir": {
-                    "type": "string",
-                    "description": "Optional working directory for the command"
-                }
-            },
-            "required": ["command"]
-        }
+    @staticmethod
+    def _fuse(patterns: list[str]) -> re.Pattern[str]:
+        """Compile patterns into one case-insensitive alternation."""
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
     
     async def execute(self, command: str, working_dir: str | None = None, **kwargs: Any) -> str:
         cwd = working_dir or self.working_dir or os.getcwd()
@@ -67,16 +90,15 @@ class ExecTool(Tool):
             return guard_error
         
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-            )
+            process = await self._spawn(command, cwd)
             
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                (stdout, out_dropped), (stderr, err_dropped), _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_capped(process.stdout),
+                        _read_capped(process.stderr),
+                        process.wait(),
+                    ),
                     timeout=self.timeout
                 )
             except asyncio.TimeoutError:
@@ -100,25 +122,48 @@ class ExecTool(Tool):
             
             # Truncate very long output
             max_len = 10000
-            if len(result) > max_len:
-                result = result[:max_len] + f"\n... (truncated, {len(result) - max_len} more chars)"
+            dropped = out_dropped + err_dropped
+            if len(result) > max_len or dropped:
+                # Dropped output was never decoded, so it can only be reported in bytes
+                more = f"{max(len(result) - max_len, 0)} more chars"
+                if dropped:
+                    more += f" + {dropped} more bytes"
+                result = result[:max_len] + f"\n... (truncated, {more})"
             
             return result
             
         except Exception as e:
             return f"Error executing command: {str(e)}"
 
+    async def _spawn(self, command: str, cwd: str) -> asyncio.subprocess.Process:
+        """Start the command, skipping the intermediate shell when it adds nothing."""
+        argv = _simple_argv(command)
+        if argv is not None:
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                )
+            except OSError:
+                pass  # e.g. a script without a shebang, which sh would still run
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+
     def _guard_command(self, command: str, cwd: str) -> str | None:
         """Best-effort safety guard for potentially destructive commands."""
         cmd = command.strip()
-        lower = cmd.lower()
 
-        for pattern in self.deny_patterns:
-            if re.search(pattern, lower):
-                return "Error: Command blocked by safety guard (dangerous pattern detected)"
+        if self._deny_re.search(cmd):
+            return "Error: Command blocked by safety guard (dangerous pattern detected)"
 
-        if self.allow_patterns:
-            if not any(re.search(p, lower) for p in self.allow_patterns):
+        if self._allow_re is not None:
+            if not self._allow_re.search(cmd):
                 return "Error: Command blocked by safety guard (not in allowlist)"
 
         if self.restrict_to_workspace:
@@ -127,10 +172,10 @@ class ExecTool(Tool):
 
             cwd_path = Path(cwd).resolve()
 
-            win_paths = re.findall(r"[A-Za-z]:\\[^\\\"']+", cmd)
-            posix_paths = re.findall(r"/[^\s\"']+", cmd)
+            # dict.fromkeys dedupes while keeping order, so each path is resolved once
+            candidates = dict.fromkeys(_WIN_PATH_RE.findall(cmd) + _POSIX_PATH_RE.findall(cmd))
 
-            for raw in win_paths + posix_paths:
+            for raw in candidates:
                 try:
                     p = Path(raw).resolve()
                 except Exception:
@@ -139,3 +184,47 @@ class ExecTool(Tool):
                     return "Error: Command blocked by safety guard (path outside working dir)"
 
         return None
+
+
+async def _read_capped(stream: asyncio.StreamReader) -> tuple[bytes, int]:
+    """
+    Read a stream to EOF, keeping at most _STREAM_CAP bytes.
+    
+    Args:
+        stream: A subprocess stdout/stderr pipe.
+    
+    Returns:
+        The kept bytes and how many bytes were discarded after them.
+    """
+    buf = bytearray()
+    dropped = 0
+    while chunk := await stream.read(65536):
+        room = _STREAM_CAP - len(buf)
+        if room > 0:
+            buf += chunk[:room]
+        dropped += max(len(chunk) - max(room, 0), 0)
+    return bytes(buf), dropped
+
+
+def _simple_argv(command: str) -> list[str] | None:
+    """
+    Split a command that a POSIX shell would run as a single program.
+    
+    Args:
+        command: The shell command line.
+    
+    Returns:
+        The argv list, or None if the command needs a shell (metacharacters,
+        builtins, variable assignments, explicit paths) or we are on Windows.
+    """
+    if os.name == "nt" or not _SHELL_METACHARS.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None  # Unbalanced quotes; let the shell report it
+    if not argv or argv[0] in _SHELL_BUILTINS or "/" in argv[0] or "=" in argv[0]:
+        return None
+    if shutil.which(argv[0]) is None:
+        return None
+    return argv
@@ -15,19 +15,31 @@ from nanobot.agent.tools.base import Tool
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
 MAX_REDIRECTS = 5  # Limit redirects to prevent DoS attacks
 
+# Compiled once; fetched pages run every one of these over the full document
+_SCRIPT_RE = re.compile(r'<script[\s\S]*?</script>', re.I)
+_STYLE_RE = re.compile(r'<style[\s\S]*?</style>', re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACES_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_LINK_RE = re.compile(r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>([\s\S]*?)</a>', re.I)
+_HEADING_RE = re.compile(r'<h([1-6])[^>]*>([\s\S]*?)</h\1>', re.I)
+_LIST_ITEM_RE = re.compile(r'<li[^>]*>([\s\S]*?)</li>', re.I)
+_BLOCK_END_RE = re.compile(r'</(p|div|section|article)>', re.I)
+_BREAK_RE = re.compile(r'<(br|hr)\s*/?>', re.I)
+
 
 def _strip_tags(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    text = re.sub(r'<script[\s\S]*?</script>', '', text, flags=re.I)
-    text = re.sub(r'<style[\s\S]*?</style>', '', text, flags=re.I)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _SCRIPT_RE.sub('', text)
+    text = _STYLE_RE.sub('', text)
+    text = _TAG_RE.sub('', text)
     return html.unescape(text).strip()
 
 
 def _normalize(text: str) -> str:
     """Normalize whitespace."""
-    text = re.sub(r'[ \t]+', ' ', text)
-    return re.sub(r'\n{3,}', '\n\n', text).strip()
+    text = _SPACES_RE.sub(' ', text)
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()
 
 
 def _validate_url(url: str) -> tuple[bool, str]:
@@ -56,10 +68,21 @@ class WebSearchTool(Tool):
         },
         "required": ["query"]
     }
+    concurrency_safe = True
     
     def __init__(self, api_key: str | None = None, max_results: int = 5):
         self.api_key = api_key or os.environ.get("BRAVE_API_KEY", "")
         self.max_results = max_results
+        # Every search goes to the same host; keep the connection alive between calls
+        self._client: httpx.AsyncClient | None = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
     
     async def execute(self, query: str, count: int | None = None, **kwargs: Any) -> str:
         if not self.api_key:
@@ -67,14 +90,12 @@ class WebSearchTool(Tool):
         
         try:
             n = min(max(count or self.max_results, 1), 10)
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": n},
-                    headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
-                    timeout=10.0
-                )
-                r.raise_for_status()
+            r = await self._get_client().get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": query, "count": n},
+                headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
+            )
+            r.raise_for_status()
             
             results = r.json().get("web", {}).get("results", [])
             if not results:
@@ -104,6 +125,7 @@ class WebFetchTool(Tool):
         },
         "required": ["url"]
     }
+    concurrency_safe = True
     
     def __init__(self, max_chars: int = 50000):
         self.max_chars = max_chars
@@ -153,11 +175,9 @@ class WebFetchTool(Tool):
     def _to_markdown(self, html: str) -> str:
         """Convert HTML to markdown."""
         # Convert links, headings, lists before stripping tags
-        text = re.sub(r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>([\s\S]*?)</a>',
-                      lambda m: f'[{_strip_tags(m[2])}]({m[1]})', html, flags=re.I)
-        text = re.sub(r'<h([1-6])[^>]*>([\s\S]*?)</h\1>',
-                      lambda m: f'\n{"#" * int(m[1])} {_strip_tags(m[2])}\n', text, flags=re.I)
-        text = re.sub(r'<li[^>]*>([\s\S]*?)</li>', lambda m: f'\n- {_strip_tags(m[1])}', text, flags=re.I)
-        text = re.sub(r'</(p|div|section|article)>', '\n\n', text, flags=re.I)
-        text = re.sub(r'<(br|hr)\s*/?>', '\n', text, flags=re.I)
+        text = _LINK_RE.sub(lambda m: f'[{_strip_tags(m[2])}]({m[1]})', html)
+        text = _HEADING_RE.sub(lambda m: f'\n{"#" * int(m[1])} {_strip_tags(m[2])}\n', text)
+        text = _LIST_ITEM_RE.sub(lambda m: f'\n- {_strip_tags(m[1])}', text)
+        text = _BLOCK_END_RE.sub('\n\n', text)
+        text = _BREAK_RE.sub('\n', text)
         return _normalize(_strip_tags(text))
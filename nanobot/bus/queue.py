@@ -21,6 +21,7 @@ class MessageBus:
         self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
         self._outbound_subscribers: dict[str, list[Callable[[OutboundMessage], Awaitable[None]]]] = {}
         self._running = False
+        self._stop_event = asyncio.Event()
     
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish a message from a channel to the agent."""
@@ -54,21 +55,32 @@ class MessageBus:
         Run this as a background task.
         """
         self._running = True
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(self.outbound.get(), timeout=1.0)
+        self._stop_event.clear()
+        stopped = asyncio.create_task(self._stop_event.wait())
+        get: asyncio.Task[OutboundMessage] | None = None
+        try:
+            while self._running:
+                get = asyncio.create_task(self.outbound.get())
+                await asyncio.wait({get, stopped}, return_when=asyncio.FIRST_COMPLETED)
+                if not get.done():
+                    break
+                msg = get.result()
                 subscribers = self._outbound_subscribers.get(msg.channel, [])
                 for callback in subscribers:
                     try:
                         await callback(msg)
                     except Exception as e:
                         logger.error(f"Error dispatching to {msg.channel}: {e}")
-            except asyncio.TimeoutError:
-                continue
+        finally:
+            # Also on cancellation: a stray get task would swallow the next message
+            if get is not None:
+                get.cancel()
+            stopped.cancel()
     
     def stop(self) -> None:
         """Stop the dispatcher loop."""
         self._running = False
+        self._stop_event.set()
     
     @property
     def inbound_size(self) -> int:
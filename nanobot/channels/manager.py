@@ -179,12 +179,10 @@ class ChannelManager:
         """Dispatch outbound messages to the appropriate channel."""
         logger.info("Outbound dispatcher started")
         
+        # Blocks on the queue; stop_all() cancels this task to end it
         while True:
             try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_outbound(),
-                    timeout=1.0
-                )
+                msg = await self.bus.consume_outbound()
                 
                 channel = self.channels.get(msg.channel)
                 if channel:
@@ -195,8 +193,6 @@ class ChannelManager:
                 else:
                     logger.warning(f"Unknown channel: {msg.channel}")
                     
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
     
@@ -360,6 +360,7 @@ def gateway(
         cron_service=cron,
         restrict_to_workspace=config.tools.restrict_to_workspace,
         session_manager=session_manager,
+        max_concurrency=config.agents.defaults.max_concurrency,
     )
     
     # Set cron callback (needs agent)
@@ -124,6 +124,7 @@ class AgentDefaults(BaseModel):
     max_tokens: int = 8192
     temperature: float = 0.7
     max_tool_iterations: int = 20
+    max_concurrency: int = 8  # Messages processed in parallel (one at a time per session)
 
 
 class AgentsConfig(BaseModel):
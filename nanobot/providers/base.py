@@ -2,8 +2,11 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
+from nanobot.utils.helpers import json_dumps
+
 
 @dataclass
 class ToolCallRequest:
@@ -11,6 +14,19 @@ class ToolCallRequest:
     id: str
     name: str
     arguments: dict[str, Any]
+    
+    @cached_property
+    def arguments_json(self) -> str:
+        """Arguments serialized once as the JSON string the message history needs."""
+        return json_dumps(self.arguments)
+    
+    def to_openai_dict(self) -> dict[str, Any]:
+        """The OpenAI-style entry for an assistant message's "tool_calls" list."""
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {"name": self.name, "arguments": self.arguments_json},
+        }
 
 
 @dataclass
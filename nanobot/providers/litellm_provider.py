@@ -9,6 +9,7 @@ from litellm import acompletion
 
 from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
 from nanobot.providers.registry import find_by_model, find_gateway
+from nanobot.utils.helpers import json_loads
 
 
 class LiteLLMProvider(LLMProvider):
@@ -99,6 +100,31 @@ class LiteLLMProvider(LLMProvider):
                     kwargs.update(overrides)
                     return
     
+    def _supports_prompt_caching(self, model: str) -> bool:
+        """Check whether the resolved provider honours cache_control markers."""
+        spec = self._gateway or find_by_model(model)
+        return bool(spec and spec.supports_prompt_caching)
+    
+    @staticmethod
+    def _apply_cache_control(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Mark the system prompt as a cache breakpoint.
+        
+        The cached prefix covers tool definitions and the system prompt, which
+        stay identical across tool-loop iterations. The caller's list is not
+        modified.
+        """
+        if not messages or messages[0].get("role") != "system":
+            return messages
+        content = messages[0].get("content")
+        if not isinstance(content, str):
+            return messages
+        system = {
+            **messages[0],
+            "content": [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}],
+        }
+        return [system, *messages[1:]]
+    
     async def chat(
         self,
         messages: list[dict[str, Any]],
@@ -122,6 +148,9 @@ class LiteLLMProvider(LLMProvider):
         """
         model = self._resolve_model(model or self.default_model)
         
+        if self._supports_prompt_caching(model):
+            messages = self._apply_cache_control(messages)
+        
         kwargs: dict[str, Any] = {
             "model": model,
             "messages": messages,
@@ -166,7 +195,7 @@ class LiteLLMProvider(LLMProvider):
                 args = tc.function.arguments
                 if isinstance(args, str):
                     try:
-                        args = json.loads(args)
+                        args = json_loads(args)
                     except json.JSONDecodeError:
                         args = {"raw": args}
                 
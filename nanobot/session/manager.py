@@ -1,6 +1,10 @@
 """Session management for conversation history."""
 
-import json
+import asyncio
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -8,7 +12,7 @@ from typing import Any
 
 from loguru import logger
 
-from nanobot.utils.helpers import ensure_dir, safe_filename
+from nanobot.utils.helpers import ensure_dir, json_dumps, json_loads, safe_filename
 
 
 @dataclass
@@ -62,13 +66,20 @@ class SessionManager:
     """
     Manages conversation sessions.
     
-    Sessions are stored as JSONL files in the sessions directory.
+    Sessions are stored as JSONL files in the sessions directory. Recently
+    used sessions are kept in memory, up to ``max_cached`` of them.
     """
     
-    def __init__(self, workspace: Path):
+    def __init__(self, workspace: Path, max_cached: int = 1000):
         self.workspace = workspace
         self.sessions_dir = ensure_dir(Path.home() / ".nanobot" / "sessions")
-        self._cache: dict[str, Session] = {}
+        self.max_cached = max_cached
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        # Every save takes the next generation for its key and a file is only ever
+        # replaced by a newer one, so a slow background write can't undo a later save
+        self._generations: dict[str, int] = {}
+        self._written: dict[str, int] = {}
+        self._replace_lock = threading.Lock()
     
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
@@ -86,17 +97,26 @@ class SessionManager:
             The session.
         """
         # Check cache
-        if key in self._cache:
-            return self._cache[key]
-        
+        session = self._cache.get(key)
+        if session is not None:
+            self._cache.move_to_end(key)
+            return session
+
         # Try to load from disk
         session = self._load(key)
         if session is None:
             session = Session(key=key)
         
-        self._cache[key] = session
+        self._remember(session)
         return session
     
+    def _remember(self, session: Session) -> None:
+        """Cache a session, evicting the least recently used beyond the limit."""
+        self._cache[session.key] = session
+        self._cache.move_to_end(session.key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+    
     def _load(self, key: str) -> Session | None:
         """Load a session from disk."""
         path = self._get_session_path(key)
@@ -109,13 +129,13 @@ class SessionManager:
             metadata = {}
             created_at = None
             
-            with open(path) as f:
+            with open(path, encoding="utf-8") as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
                     
-                    data = json.loads(line)
+                    data = json_loads(line)
                     
                     if data.get("_type") == "metadata":
                         metadata = data.get("metadata", {})
@@ -135,23 +155,64 @@ class SessionManager:
     
     def save(self, session: Session) -> None:
         """Save a session to disk."""
-        path = self._get_session_path(session.key)
-        
-        with open(path, "w") as f:
-            # Write metadata first
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata
-            }
-            f.write(json.dumps(metadata_line) + "\n")
-            
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
+        self._write(session.key, self._next_generation(session.key), self._serialize(session))
+        self._remember(session)
+    
+    async def save_async(self, session: Session) -> None:
+        """
+        Save a session without blocking the event loop on file I/O.
         
-        self._cache[session.key] = session
+        The session is serialized on the calling thread, so later changes to it
+        can't race with the write. If a newer save() or save_async() of the same
+        session lands first, this snapshot is discarded instead of written.
+        """
+        data = self._serialize(session)
+        generation = self._next_generation(session.key)
+        self._remember(session)
+        await asyncio.to_thread(self._write, session.key, generation, data)
+    
+    def _next_generation(self, key: str) -> int:
+        """Number the next save of a session; later saves get higher numbers."""
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        return generation
+    
+    @staticmethod
+    def _serialize(session: Session) -> str:
+        """Render a session as JSONL: a metadata line followed by one line per message."""
+        metadata_line = {
+            "_type": "metadata",
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata
+        }
+        lines = [json_dumps(metadata_line)]
+        lines.extend(json_dumps(msg) for msg in session.messages)
+        lines.append("")
+        return "\n".join(lines)
+    
+    def _write(self, key: str, generation: int, data: str) -> None:
+        """
+        Replace a session file atomically so readers never see a partial write.
+        
+        Args:
+            key: Session key.
+            generation: From _next_generation() when ``data`` was serialized.
+            data: Serialized session.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.sessions_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            with self._replace_lock:
+                if generation < self._written.get(key, 0):
+                    Path(tmp).unlink()  # A newer snapshot is already on disk
+                    return
+                os.replace(tmp, self._get_session_path(key))
+                self._written[key] = generation
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
     
     def delete(self, key: str) -> bool:
         """
@@ -185,10 +246,10 @@ class SessionManager:
         for path in self.sessions_dir.glob("*.jsonl"):
             try:
                 # Read just the metadata line
-                with open(path) as f:
+                with open(path, encoding="utf-8") as f:
                     first_line = f.readline().strip()
                     if first_line:
-                        data = json.loads(first_line)
+                        data = json_loads(first_line)
                         if data.get("_type") == "metadata":
                             sessions.append({
                                 "key": path.stem.replace("_", ":"),
@@ -1,7 +1,14 @@
 """Utility functions for nanobot."""
 
+import json
 from pathlib import Path
 from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install nanobot-ai[speedups])
+    orjson = None
 
 
 def ensure_dir(path: Path) -> Path:
@@ -75,6 +82,52 @@ def safe_filename(name: str) -> str:
     return name.strip()
 
 
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass  # Non-str keys, ints beyond 64 bits, etc.
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals etc.; let json decide
+    return json.loads(data)
+
+
+def read_text_cached(path: Path, cache: dict[Path, tuple[int, int, str]]) -> str | None:
+    """
+    Read a UTF-8 text file, reusing the cached content while it is unchanged.
+    
+    Args:
+        path: File to read.
+        cache: Caller-owned map of path -> (mtime_ns, size, content).
+    
+    Returns:
+        The file content, or None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        cache.pop(path, None)
+        return None
+    
+    hit = cache.get(path)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    
+    content = path.read_text(encoding="utf-8")
+    cache[path] = (st.st_mtime_ns, st.st_size, content)
+    return content
+
+
 def parse_session_key(key: str) -> tuple[str, str]:
     """
     Parse a session key into channel and chat_id.
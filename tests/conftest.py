@@ -0,0 +1,27 @@
+from typing import Any, Callable
+
+import pytest
+
+from nanobot.providers.base import LLMProvider, LLMResponse
+
+
+class ScriptedProvider(LLMProvider):
+    """Returns queued responses and records the messages it was sent."""
+
+    def __init__(self, responses: list[LLMResponse]) -> None:
+        super().__init__()
+        self.responses = responses
+        self.calls: list[list[dict[str, Any]]] = []
+
+    async def chat(self, messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        self.calls.append(list(messages))
+        return self.responses.pop(0)
+
+    def get_default_model(self) -> str:
+        return "test-model"
+
+
+@pytest.fixture
+def scripted_provider() -> Callable[[list[LLMResponse]], ScriptedProvider]:
+    """Factory for a provider that plays back the given responses in order."""
+    return ScriptedProvider
@@ -0,0 +1,240 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from nanobot.session.manager import SessionManager
+
+
+class BlockingProvider(LLMProvider):
+    """Replies with the last user message once released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+        self.active = 0
+        self.max_active = 0
+
+    async def chat(self, messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return LLMResponse(content=f"re: {messages[-1]['content']}")
+
+    def get_default_model(self) -> str:
+        return "test-model"
+
+
+class RoutingProvider(LLMProvider):
+    """Has every session call the message tool once both are mid-turn."""
+
+    def __init__(self, sessions: int) -> None:
+        super().__init__()
+        self.sessions = sessions
+        self.waiting = 0
+        self.all_waiting = asyncio.Event()
+
+    async def chat(self, messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        if messages[-1]["role"] == "tool":
+            return LLMResponse(content="done")
+        text = messages[-1]["content"]
+        self.waiting += 1
+        if self.waiting == self.sessions:
+            self.all_waiting.set()
+        await self.all_waiting.wait()
+        call = ToolCallRequest(id=f"c-{text}", name="message", arguments={"content": f"note for {text}"})
+        return LLMResponse(content=None, tool_calls=[call])
+
+    def get_default_model(self) -> str:
+        return "test-model"
+
+
+@pytest.fixture
+def make_loop(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+    def _make(provider: LLMProvider, **kwargs: Any) -> tuple[AgentLoop, MessageBus]:
+        bus = MessageBus()
+        loop = AgentLoop(
+            bus=bus,
+            provider=provider,
+            workspace=tmp_path,
+            session_manager=SessionManager(tmp_path),
+            **kwargs,
+        )
+        return loop, bus
+
+    return _make
+
+
+def _msg(chat_id: str, content: str) -> InboundMessage:
+    return InboundMessage(channel="test", sender_id="u", chat_id=chat_id, content=content)
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    async def poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def test_run_processes_sessions_concurrently(make_loop) -> None:
+    provider = BlockingProvider()
+    loop, bus = make_loop(provider, max_concurrency=4)
+    runner = asyncio.create_task(loop.run())
+
+    await bus.publish_inbound(_msg("a", "one"))
+    await bus.publish_inbound(_msg("b", "two"))
+    await _wait_for(lambda: provider.active == 2)
+
+    provider.release.set()
+    replies = {(await bus.consume_outbound()).content for _ in range(2)}
+    assert replies == {"re: one", "re: two"}
+
+    loop.stop()
+    await runner
+
+
+async def test_run_serializes_messages_within_a_session(make_loop) -> None:
+    provider = BlockingProvider()
+    loop, bus = make_loop(provider, max_concurrency=4)
+    runner = asyncio.create_task(loop.run())
+
+    await bus.publish_inbound(_msg("a", "first"))
+    await bus.publish_inbound(_msg("a", "second"))
+    await _wait_for(lambda: provider.active == 1)
+    await asyncio.sleep(0.05)
+    assert provider.max_active == 1
+
+    provider.release.set()
+    first = await bus.consume_outbound()
+    second = await bus.consume_outbound()
+    assert [first.content, second.content] == ["re: first", "re: second"]
+
+    loop.stop()
+    await runner
+
+
+async def test_message_tool_replies_to_its_own_session_under_concurrency(make_loop) -> None:
+    loop, bus = make_loop(RoutingProvider(sessions=2), max_concurrency=4)
+    runner = asyncio.create_task(loop.run())
+
+    await bus.publish_inbound(_msg("a", "a"))
+    await bus.publish_inbound(_msg("b", "b"))
+    sent = [await asyncio.wait_for(bus.consume_outbound(), 2) for _ in range(4)]
+
+    notes = {m.content: m.chat_id for m in sent if m.content.startswith("note")}
+    assert notes == {"note for a": "a", "note for b": "b"}
+
+    loop.stop()
+    await runner
+
+
+async def test_cancelled_run_leaves_later_messages_on_the_bus(make_loop) -> None:
+    loop, bus = make_loop(BlockingProvider())
+    runner = asyncio.create_task(loop.run())
+    await asyncio.sleep(0.01)
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+    await bus.publish_inbound(_msg("a", "after cancel"))
+    await asyncio.sleep(0.01)
+
+    assert bus.inbound.qsize() == 1
+
+
+async def test_process_direct_runs_tool_calls_then_answers(make_loop, tmp_path: Path, scripted_provider) -> None:
+    (tmp_path / "notes.txt").write_text("hello", encoding="utf-8")
+    provider = scripted_provider([
+        LLMResponse(
+            content=None,
+            tool_calls=[ToolCallRequest(id="c1", name="read_file", arguments={"path": str(tmp_path / "notes.txt")})],
+        ),
+        LLMResponse(content="the file says hello"),
+    ])
+    loop, _ = make_loop(provider)
+
+    reply = await loop.process_direct("what is in notes.txt?")
+
+    assert reply == "the file says hello"
+    assistant, tool_result = provider.calls[1][-2:]
+    assert assistant["tool_calls"][0]["id"] == "c1"
+    assert tool_result == {"role": "tool", "tool_call_id": "c1", "name": "read_file", "content": "hello"}
+
+
+async def test_stop_wakes_an_idle_run_loop(make_loop) -> None:
+    loop, _ = make_loop(BlockingProvider())
+    runner = asyncio.create_task(loop.run())
+    await asyncio.sleep(0.01)
+
+    loop.stop()
+    await asyncio.wait_for(runner, timeout=0.5)
+
+
+async def test_process_direct_saves_the_session_before_returning(make_loop, tmp_path: Path, scripted_provider) -> None:
+    loop, _ = make_loop(scripted_provider([LLMResponse(content="hi there")]))
+
+    await loop.process_direct("hello", session_key="cli:direct")
+
+    reloaded = SessionManager(tmp_path)._load("cli:direct")
+    assert reloaded is not None
+    assert [m["content"] for m in reloaded.messages] == ["hello", "hi there"]
+
+
+async def test_tool_loop_stops_when_a_failing_call_is_repeated(make_loop, tmp_path: Path, scripted_provider) -> None:
+    missing = ToolCallRequest(id="c1", name="read_file", arguments={"path": str(tmp_path / "missing.txt")})
+    provider = scripted_provider([
+        LLMResponse(content=None, tool_calls=[missing]),
+        LLMResponse(content=None, tool_calls=[missing]),
+        LLMResponse(content="unreachable"),
+    ])
+    loop, _ = make_loop(provider)
+
+    reply = await loop.process_direct("read missing.txt")
+
+    assert reply.startswith("Stopped:")
+    assert len(provider.calls) == 2
+
+
+async def test_tool_loop_allows_retrying_a_call_after_fixing_its_cause(make_loop, tmp_path: Path, scripted_provider) -> None:
+    path = str(tmp_path / "later.txt")
+    read = ToolCallRequest(id="c1", name="read_file", arguments={"path": path})
+    write = ToolCallRequest(id="c2", name="write_file", arguments={"path": path, "content": "now here"})
+    provider = scripted_provider([
+        LLMResponse(content=None, tool_calls=[read]),
+        LLMResponse(content=None, tool_calls=[write]),
+        LLMResponse(content=None, tool_calls=[read]),
+        LLMResponse(content="it says now here"),
+    ])
+    loop, _ = make_loop(provider)
+
+    reply = await loop.process_direct("create later.txt and read it back")
+
+    assert reply == "it says now here"
+    assert provider.calls[3][-1]["content"] == "now here"
+
+
+async def test_process_direct_attaches_images_from_media(make_loop, tmp_path: Path, scripted_provider) -> None:
+    image = tmp_path / "cat.png"
+    image.write_bytes(b"\x89PNG")
+    provider = scripted_provider([LLMResponse(content="a cat")])
+    loop, _ = make_loop(provider)
+
+    response = await loop._process_message(
+        InboundMessage(channel="test", sender_id="u", chat_id="a", content="what is this?", media=[str(image)])
+    )
+
+    assert response.content == "a cat"
+    content = provider.calls[0][-1]["content"]
+    assert content[0]["image_url"]["url"] == "data:image/png;base64,iVBORw=="
+    assert content[1] == {"type": "text", "text": "what is this?"}
+    await loop.flush_saves()
@@ -0,0 +1,32 @@
+import math
+import os
+from pathlib import Path
+
+from nanobot.utils.helpers import json_loads, read_text_cached
+
+
+def test_read_text_cached_rereads_only_after_a_change(tmp_path: Path) -> None:
+    path = tmp_path / "SKILL.md"
+    cache: dict[Path, tuple[int, int, str]] = {}
+    assert read_text_cached(path, cache) is None
+
+    path.write_text("v1", encoding="utf-8")
+    assert read_text_cached(path, cache) == "v1"
+
+    # A stale cache entry is served as long as mtime and size match
+    st = path.stat()
+    cache[path] = (st.st_mtime_ns, st.st_size, "cached")
+    assert read_text_cached(path, cache) == "cached"
+
+    path.write_text("v2!", encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert read_text_cached(path, cache) == "v2!"
+
+    path.unlink()
+    assert read_text_cached(path, cache) is None
+    assert path not in cache
+
+
+def test_json_loads_accepts_what_the_stdlib_accepts() -> None:
+    assert json_loads('{"path": "é", "n": [1, 2.5]}') == {"path": "é", "n": [1, 2.5]}
+    assert math.isnan(json_loads('{"x": NaN}')["x"])
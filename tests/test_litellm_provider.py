@@ -0,0 +1,28 @@
+from nanobot.providers.litellm_provider import LiteLLMProvider
+
+
+def test_anthropic_system_prompt_gets_cache_breakpoint() -> None:
+    provider = LiteLLMProvider(default_model="anthropic/claude-opus-4-5")
+    messages = [
+        {"role": "system", "content": "You are nanobot."},
+        {"role": "user", "content": "hi"},
+    ]
+
+    assert provider._supports_prompt_caching("anthropic/claude-opus-4-5")
+    marked = provider._apply_cache_control(messages)
+
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "You are nanobot.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert marked[1] is messages[1]
+    assert messages[0]["content"] == "You are nanobot."
+
+
+def test_other_providers_are_left_alone(monkeypatch) -> None:
+    # The gateway constructor exports its key; let monkeypatch restore it
+    monkeypatch.setenv("OPENROUTER_API_KEY", "")
+    provider = LiteLLMProvider(default_model="gpt-4o")
+    assert not provider._supports_prompt_caching("gpt-4o")
+
+    gateway = LiteLLMProvider(api_key="sk-or-test", default_model="anthropic/claude-opus-4-5")
+    assert not gateway._supports_prompt_caching("openrouter/anthropic/claude-opus-4-5")
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from nanobot.bus.events import OutboundMessage
+from nanobot.bus.queue import MessageBus
+
+
+async def test_dispatch_outbound_delivers_and_stops_promptly() -> None:
+    bus = MessageBus()
+    received: list[str] = []
+
+    async def on_message(msg: OutboundMessage) -> None:
+        received.append(msg.content)
+
+    bus.subscribe_outbound("test", on_message)
+    dispatcher = asyncio.create_task(bus.dispatch_outbound())
+
+    await bus.publish_outbound(OutboundMessage(channel="test", chat_id="c", content="hi"))
+    await asyncio.sleep(0.01)
+    assert received == ["hi"]
+
+    bus.stop()
+    await asyncio.wait_for(dispatcher, timeout=0.5)
+
+
+async def test_cancelled_dispatcher_leaves_later_messages_queued() -> None:
+    bus = MessageBus()
+    received: list[str] = []
+
+    async def on_message(msg: OutboundMessage) -> None:
+        received.append(msg.content)
+
+    bus.subscribe_outbound("test", on_message)
+    dispatcher = asyncio.create_task(bus.dispatch_outbound())
+    await asyncio.sleep(0.01)
+
+    dispatcher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await dispatcher
+    await bus.publish_outbound(OutboundMessage(channel="test", chat_id="c", content="later"))
+    await asyncio.sleep(0.01)
+
+    assert received == []
+    assert bus.outbound_size == 1
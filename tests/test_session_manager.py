@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from pathlib import Path
+
+from nanobot.session.manager import SessionManager
+
+
+def test_cache_evicts_least_recently_used_session(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = SessionManager(tmp_path, max_cached=2)
+
+    a = manager.get_or_create("test:a")
+    a.add_message("user", "hello")
+    manager.save(a)
+    manager.get_or_create("test:b")
+    assert manager.get_or_create("test:a") is a  # refreshes "a"
+    manager.get_or_create("test:c")
+
+    assert list(manager._cache) == ["test:a", "test:c"]
+
+    manager.get_or_create("test:b")
+    reloaded = manager.get_or_create("test:a")
+    assert reloaded is not a
+    assert reloaded.get_history() == [{"role": "user", "content": "hello"}]
+
+
+async def test_save_async_writes_a_snapshot_in_order(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = SessionManager(tmp_path)
+    session = manager.get_or_create("test:a")
+
+    session.add_message("user", "one")
+    first = asyncio.create_task(manager.save_async(session))
+    await asyncio.sleep(0)  # let it take its snapshot
+    session.add_message("assistant", "two")
+    second = asyncio.create_task(manager.save_async(session))
+    await asyncio.gather(first, second)
+
+    reloaded = SessionManager(tmp_path)._load("test:a")
+    assert [m["content"] for m in reloaded.messages] == ["one", "two"]
+    assert not list(manager.sessions_dir.glob("*.tmp"))
+
+
+async def test_stale_background_save_does_not_undo_a_later_save(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = SessionManager(tmp_path)
+    session = manager.get_or_create("test:a")
+    session.add_message("user", "secret")
+
+    # Hold the background write back until the synchronous save has finished
+    release = threading.Event()
+    write = manager._write
+
+    def slow_write(key: str, generation: int, data: str) -> None:
+        if generation == 1:
+            release.wait(timeout=2)
+        write(key, generation, data)
+
+    monkeypatch.setattr(manager, "_write", slow_write)
+    background = asyncio.create_task(manager.save_async(session))
+    await asyncio.sleep(0.01)
+
+    session.clear()
+    manager.save(session)  # what /reset does
+    release.set()
+    await background
+
+    reloaded = SessionManager(tmp_path)._load("test:a")
+    assert reloaded.messages == []
+    assert not list(manager.sessions_dir.glob("*.tmp"))
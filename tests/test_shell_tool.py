@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from nanobot.agent.tools import shell
+from nanobot.agent.tools.shell import ExecTool, _simple_argv
+
+
+def test_guard_blocks_deny_patterns_regardless_of_case(tmp_path: Path) -> None:
+    tool = ExecTool()
+    cwd = str(tmp_path)
+    assert "dangerous pattern" in tool._guard_command("rm -rf build", cwd)
+    assert "dangerous pattern" in tool._guard_command("RM -RF build", cwd)
+    assert "dangerous pattern" in tool._guard_command("sudo Shutdown now", cwd)
+    assert tool._guard_command("ls -la", cwd) is None
+
+
+def test_guard_allowlist(tmp_path: Path) -> None:
+    tool = ExecTool(allow_patterns=[r"^git\b", r"^ls\b"])
+    cwd = str(tmp_path)
+    assert tool._guard_command("git status", cwd) is None
+    assert tool._guard_command("LS", cwd) is None
+    assert "not in allowlist" in tool._guard_command("cat notes.txt", cwd)
+
+
+def test_guard_restricts_absolute_paths_to_workspace(tmp_path: Path) -> None:
+    tool = ExecTool(restrict_to_workspace=True)
+    cwd = str(tmp_path)
+    assert tool._guard_command(f"cat {tmp_path}/a.txt {tmp_path}/a.txt", cwd) is None
+    assert "outside working dir" in tool._guard_command("cat /etc/passwd", cwd)
+    assert "path traversal" in tool._guard_command("cat ../secret", cwd)
+
+
+def test_simple_argv_only_for_plain_commands(monkeypatch) -> None:
+    # Pretend every name is on PATH so builtins with a binary twin (/usr/bin/cd) are covered
+    monkeypatch.setattr(shell.shutil, "which", lambda name: f"/usr/bin/{name}")
+    assert _simple_argv("ls -la 'my dir'") == ["ls", "-la", "my dir"]
+    assert _simple_argv("ls | wc -l") is None
+    assert _simple_argv("echo $HOME") is None
+    assert _simple_argv("cd src") is None
+    assert _simple_argv("echo -e x") is None
+    assert _simple_argv("FOO=1 ls") is None
+    assert _simple_argv("./run.sh") is None
+    assert _simple_argv("echo 'unterminated") is None
+
+
+async def test_execute_runs_plain_and_shell_commands(tmp_path: Path) -> None:
+    tool = ExecTool(working_dir=str(tmp_path))
+    assert await tool.execute("echo 'hello world'") == "hello world\n"
+    assert await tool.execute("echo abc | tr a x") == "xbc\n"
+    assert await tool.execute("printf '%s-' a b") == "a-b-"
+    assert "Exit code: 3" in await tool.execute("sh -c 'exit 3'")
+
+
+async def test_execute_caps_large_output(tmp_path: Path) -> None:
+    tool = ExecTool(working_dir=str(tmp_path))
+    result = await tool.execute("head -c 1000000 /dev/zero | tr '\\0' x")
+    assert result.startswith("x" * 10000)
+    assert result.endswith("(truncated, 55536 more chars + 934464 more bytes)")
+
+
+async def test_execute_truncates_without_dropping(tmp_path: Path) -> None:
+    tool = ExecTool(working_dir=str(tmp_path))
+    result = await tool.execute("head -c 12000 /dev/zero | tr '\\0' x")
+    assert result.endswith("(truncated, 2000 more chars)")
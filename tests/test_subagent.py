@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from nanobot.agent.subagent import SubagentManager
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMResponse, ToolCallRequest
+
+
+async def test_subagent_runs_tools_and_announces_result(tmp_path: Path, scripted_provider) -> None:
+    (tmp_path / "notes.txt").write_text("hello", encoding="utf-8")
+    provider = scripted_provider([
+        LLMResponse(
+            content=None,
+            tool_calls=[ToolCallRequest(id="c1", name="read_file", arguments={"path": str(tmp_path / "notes.txt")})],
+        ),
+        LLMResponse(content="notes say hello"),
+    ])
+    bus = MessageBus()
+    manager = SubagentManager(provider=provider, workspace=tmp_path, bus=bus)
+
+    await manager.spawn("read notes.txt", origin_channel="test", origin_chat_id="c")
+    announce = await bus.consume_inbound()
+
+    assert announce.channel == "system"
+    assert announce.chat_id == "test:c"
+    assert "notes say hello" in announce.content
+    assert provider.calls[1][-1]["content"] == "hello"
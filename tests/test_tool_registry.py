@@ -0,0 +1,93 @@
+import asyncio
+from typing import Any
+
+from nanobot.agent.tools.base import Tool
+from nanobot.agent.tools.registry import ToolRegistry
+
+
+class RecordingTool(Tool):
+    def __init__(self, name: str, log: list[str], concurrency_safe: bool = False) -> None:
+        self._name = name
+        self._log = log
+        self.concurrency_safe = concurrency_safe
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "records start/end of each call"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"value": {"type": "string"}}}
+
+    async def execute(self, value: str = "", **kwargs: Any) -> str:
+        self._log.append(f"start {self._name}:{value}")
+        await asyncio.sleep(0.01)
+        self._log.append(f"end {self._name}:{value}")
+        return f"{self._name}:{value}"
+
+
+async def test_execute_batch_preserves_order_and_overlaps_safe_calls() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(RecordingTool("read", log, concurrency_safe=True))
+    reg.register(RecordingTool("write", log))
+
+    results = await reg.execute_batch([
+        ("read", {"value": "a"}),
+        ("read", {"value": "b"}),
+        ("write", {"value": "c"}),
+        ("read", {"value": "d"}),
+    ])
+
+    assert results == ["read:a", "read:b", "write:c", "read:d"]
+    # Both reads started before either finished; the write waited for them.
+    assert log[:2] == ["start read:a", "start read:b"]
+    assert log[4:] == ["start write:c", "end write:c", "start read:d", "end read:d"]
+
+
+async def test_execute_batch_reports_unknown_tool_in_place() -> None:
+    reg = ToolRegistry()
+    reg.register(RecordingTool("read", [], concurrency_safe=True))
+
+    results = await reg.execute_batch([("read", {"value": "a"}), ("missing", {})])
+
+    assert results[0] == "read:a"
+    assert results[1] == "Error: Tool 'missing' not found"
+
+
+def test_get_definitions_is_cached_until_registry_changes() -> None:
+    reg = ToolRegistry()
+    reg.register(RecordingTool("read", []))
+
+    first = reg.get_definitions()
+    assert reg.get_definitions() is first
+
+    reg.register(RecordingTool("write", []))
+    second = reg.get_definitions()
+    assert second is not first
+    assert [d["function"]["name"] for d in second] == ["read", "write"]
+
+    reg.unregister("read")
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["write"]
+
+
+async def test_execute_batch_runs_identical_safe_calls_once() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(RecordingTool("read", log, concurrency_safe=True))
+    reg.register(RecordingTool("write", log))
+
+    results = await reg.execute_batch([
+        ("read", {"value": "a"}),
+        ("read", {"value": "a"}),
+        ("write", {"value": "b"}),
+        ("write", {"value": "b"}),
+    ])
+
+    assert results == ["read:a", "read:a", "write:b", "write:b"]
+    assert log.count("start read:a") == 1
+    assert log.count("start write:b") == 2
@@ -86,3 +86,16 @@ async def test_registry_returns_validation_error() -> None:
     reg.register(SampleTool())
     result = await reg.execute("sample", {"query": "hi"})
     assert "Invalid parameters" in result
+
+
+def test_validator_is_compiled_once_per_tool() -> None:
+    tool = SampleTool()
+    assert tool.validator is tool.validator
+    assert tool.validate_params({"query": "hi", "count": 2}) == []
+    assert tool.validate_params({"query": "hi", "count": 11}) == ["count must be <= 10"]
+
+
+def test_registry_compiles_validator_on_register() -> None:
+    tool = SampleTool()
+    ToolRegistry().register(tool)
+    assert "validator" in tool.__dict__